@@ -2,19 +2,22 @@
 
 import asyncio
 import os
+import queue
 import shlex
 import subprocess
 import sys
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import suppress
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import questionary
 
 from .messages import MessageStore
 from .session import SessionManager
-from .sync import FileSyncWatcher, get_available_directory
-from .tui import THEME_PRIMARY, THEME_SECONDARY, ClaudeUI
+from .theme import THEME_PRIMARY, THEME_SECONDARY
 from .utils import (
     OUTPUT_LANGUAGE_EXTENSIONS,
     generate_folder_name,
@@ -23,6 +26,9 @@ from .utils import (
     get_scripts_dir,
 )
 
+if TYPE_CHECKING:
+    from .sync import FileSyncWatcher
+
 DEBUG = os.environ.get("DEBUG", "0") == "1"
 
 OTHER_OPTION = "Other (type your answer)"
@@ -38,6 +44,41 @@ NON_INTERACTIVE_ASK_USER_MESSAGE = (
 class BaseEngineer(ABC):
     """Abstract base class for API reverse engineering implementations."""
 
+    # Attributes owned by the base class. Concrete engineers don't declare
+    # their own __slots__ (they keep a __dict__ for SDK state and test
+    # patching), so this only makes base attribute access slot-backed.
+    __slots__ = (
+        "run_id",
+        "_har_path",
+        "_har_path_str",
+        "_har_dir_str",
+        "prompt",
+        "model",
+        "additional_instructions",
+        "output_mode",
+        "_scripts_dir",
+        "_scripts_dir_str",
+        "_verbose",
+        "_ui",
+        "usage_metadata",
+        "message_store",
+        "_messages_dir_str",
+        "enable_sync",
+        "sdk",
+        "_is_fresh",
+        "_is_fresh_str",
+        "output_language",
+        "existing_client_path",
+        "sync_watcher",
+        "local_scripts_dir",
+        "_sync_events",
+        "_sync_drain_thread",
+        "_stderr_error_shown",
+        "interactive",
+        "_json_event_sink",
+        "_analysis_prompts",
+    )
+
     # Single source of truth lives in utils.OUTPUT_LANGUAGE_EXTENSIONS so
     # script discovery and the run command dispatch stay in sync with codegen.
     _OUTPUT_LANGUAGE_EXTENSIONS = OUTPUT_LANGUAGE_EXTENSIONS
@@ -71,9 +112,13 @@ class BaseEngineer(ABC):
         else:
             self.scripts_dir = get_scripts_dir(run_id, output_dir)
 
-        self.ui = ClaudeUI(verbose=verbose)
+        # The Rich UI is built on first access (see the ui property); subclasses
+        # that install their own UI never construct a ClaudeUI at all.
+        self._verbose = verbose
+        self._ui: Any = None
         self.usage_metadata: dict[str, Any] = {}
         self.message_store = MessageStore(run_id, output_dir)
+        self._messages_dir_str = str(self.message_store.messages_path.parent)
         self.enable_sync = enable_sync
         self.sdk = sdk
         self.is_fresh = is_fresh
@@ -81,12 +126,68 @@ class BaseEngineer(ABC):
         self.existing_client_path = self._get_existing_client_path()
         self.sync_watcher: FileSyncWatcher | None = None
         self.local_scripts_dir: Path | None = None
+        # Watcher callbacks only enqueue; one drain thread owns UI output.
+        self._sync_events: queue.SimpleQueue[tuple[str, str] | threading.Event | None] | None = None
+        self._sync_drain_thread: threading.Thread | None = None
         self._stderr_error_shown = False
         # When False, _prompt_follow_up() returns None immediately so the
         # conversation loop in subclasses ends after the first generation.
         # Set this from --json / --no-interactive entry points.
         self.interactive = interactive
         self._json_event_sink: Any = None
+        # The rendered pair is built on first use and reused across retries;
+        # the har_path, scripts_dir and is_fresh setters reset it.
+        self._analysis_prompts: tuple[str, str] | None = None
+
+    @property
+    def ui(self) -> Any:
+        """Terminal UI, created on first use."""
+        if self._ui is None:
+            from .tui import ClaudeUI
+
+            self._ui = ClaudeUI(verbose=self._verbose)
+        return self._ui
+
+    @ui.setter
+    def ui(self, value: Any) -> None:
+        self._ui = value
+
+    @property
+    def har_path(self) -> Path:
+        """HAR file being analyzed."""
+        return self._har_path
+
+    @har_path.setter
+    def har_path(self, value: Path) -> None:
+        # Prompt rendering wants these as strings; har_path.parent would
+        # build a new Path on every access.
+        self._har_path = value
+        self._har_path_str = str(value)
+        self._har_dir_str = str(value.parent)
+        self._analysis_prompts = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether to start fresh, ignoring previous scripts."""
+        return self._is_fresh
+
+    @is_fresh.setter
+    def is_fresh(self, value: bool) -> None:
+        self._is_fresh = value
+        self._is_fresh_str = "true" if value else "false"
+        self._analysis_prompts = None
+
+    @property
+    def scripts_dir(self) -> Path:
+        """Directory the generated client (or docs) is written to."""
+        return self._scripts_dir
+
+    @scripts_dir.setter
+    def scripts_dir(self, value: Path) -> None:
+        # Keep the derived forms in step with the path they came from.
+        self._scripts_dir = value
+        self._scripts_dir_str = str(value)
+        self._analysis_prompts = None
 
     def _emit_json_event(self, event: dict[str, Any]) -> None:
         sink = self._json_event_sink
@@ -122,6 +223,8 @@ class BaseEngineer(ABC):
         if not self.enable_sync:
             return
 
+        from .sync import FileSyncWatcher, get_available_directory
+
         # Generate local directory name
         base_name = generate_folder_name(self.prompt, sdk=self.sdk)
 
@@ -136,23 +239,92 @@ class BaseEngineer(ABC):
 
         self.local_scripts_dir = local_dir
 
-        # Create sync watcher
-        def on_sync(message):
-            self.ui.sync_flash(message)
+        events: queue.SimpleQueue[tuple[str, str] | threading.Event | None] = queue.SimpleQueue()
+        self._sync_events = events
+        self._sync_drain_thread = threading.Thread(target=self._drain_sync_events, args=(events,), daemon=True)
+        self._sync_drain_thread.start()
+
+        # Create sync watcher; each burst of writes is reported as one batch.
+        # The batch window is the only delay on this path: the drain thread
+        # and ui.sync_flash render immediately, so don't add sleeps there.
+        def on_sync_batch(messages):
+            events.put(("sync", self._summarize_sync_batch(messages)))
 
         def on_error(message):
-            self.ui.sync_error(message)
+            events.put(("error", message))
 
         self.sync_watcher = FileSyncWatcher(
             source_dir=self.scripts_dir,
             dest_dir=local_dir,
-            on_sync=on_sync,
+            on_sync_batch=on_sync_batch,
             on_error=on_error,
-            debounce_ms=500,
+            batch_window_ms=800,
         )
         self.sync_watcher.start()
         self.ui.sync_started(str(local_dir))
 
+    @staticmethod
+    def _summarize_sync_batch(messages: list[str]) -> str:
+        """Collapse a batch of "Synced x" / "Deleted x" messages into one line."""
+        if len(messages) == 1:
+            return messages[0]
+        deleted = sum(1 for message in messages if message.startswith("Deleted "))
+        synced = len(messages) - deleted
+        if not deleted:
+            return f"Synced {synced} files"
+        if not synced:
+            return f"Deleted {deleted} files"
+        return f"Synced {synced} file{'s' if synced != 1 else ''}, deleted {deleted}"
+
+    def _drain_sync_events(self, events: queue.SimpleQueue[tuple[str, str] | threading.Event | None]) -> None:
+        """Render queued sync events until the None sentinel arrives.
+
+        Everything already queued is handled in one pass: errors are all
+        shown, while a run of sync notifications collapses to the latest.
+        Barrier events (see flush_sync) are set once that pass is rendered.
+        """
+        while True:
+            pending = [events.get()]
+            while True:
+                try:
+                    pending.append(events.get_nowait())
+                except queue.Empty:
+                    break
+
+            last_sync = None
+            barriers = []
+            stopping = False
+            try:
+                for event in pending:
+                    if event is None:
+                        stopping = True
+                        break
+                    if isinstance(event, threading.Event):
+                        barriers.append(event)
+                        continue
+                    kind, message = event
+                    if kind == "error":
+                        self._render_sync_event(self.ui.sync_error, message)
+                    else:
+                        last_sync = message
+                if last_sync is not None:
+                    self._render_sync_event(self.ui.sync_flash, last_sync)
+            finally:
+                # Never leave flush_sync() waiting out its timeout
+                for barrier in barriers:
+                    barrier.set()
+            if stopping:
+                return
+
+    @staticmethod
+    def _render_sync_event(render: Any, message: str) -> None:
+        """Render one sync message; a UI failure must not kill the drain thread."""
+        try:
+            render(message)
+        except Exception:
+            # The UI is the only place to report this, and it just failed
+            pass
+
     def stop_sync(self):
         """Stop real-time file sync."""
         if self.sync_watcher:
@@ -163,10 +335,31 @@ class BaseEngineer(ABC):
             finally:
                 self.sync_watcher = None
 
+        # Stop the drain thread after the watcher's final sync is queued
+        if self._sync_events is not None:
+            self._sync_events.put(None)
+            self._sync_events = None
+        if self._sync_drain_thread is not None:
+            self._sync_drain_thread.join(timeout=2)
+            self._sync_drain_thread = None
+
     def flush_sync(self):
-        """Flush pending sync events and ensure all files are synced locally."""
+        """Flush pending sync events and ensure all files are synced locally.
+
+        Returns only after the drain thread has rendered the resulting
+        messages, so they can't interleave with whatever the caller prints next.
+        """
         if self.sync_watcher:
             self.sync_watcher.flush()
+        if self._sync_events is not None and self._sync_drain_thread is not None:
+            barrier = threading.Event()
+            self._sync_events.put(barrier)
+            barrier.wait(timeout=2)
+
+    async def flush_sync_async(self) -> None:
+        """Flush sync from async code; the full-directory copy runs in the default executor."""
+        if self.sync_watcher:
+            await asyncio.get_running_loop().run_in_executor(None, self.flush_sync)
 
     def get_sync_status(self) -> dict | None:
         """Get current sync status."""
@@ -338,10 +531,10 @@ class BaseEngineer(ABC):
         """
         if not self.interactive:
             # Still flush sync so any partial output reaches disk before we exit.
-            self.flush_sync()
+            await self.flush_sync_async()
             return None
         # Ensure all files are synced locally before waiting for user input
-        self.flush_sync()
+        await self.flush_sync_async()
         self.ui.console.print()
         self.ui.console.print(f"  [{THEME_PRIMARY}]─[/{THEME_PRIMARY}] [dim]type a follow-up or press Enter to finish[/dim]")
         try:
@@ -595,15 +788,22 @@ class BaseEngineer(ABC):
         from .prompts import load
 
         if self.output_mode == "docs":
-            return load("partials/_docs_instructions", scripts_dir=str(self.scripts_dir))
+            return load("partials/_docs_instructions", scripts_dir=self._scripts_dir_str)
 
         return load(
             f"partials/_language_{self.output_language}",
-            scripts_dir=str(self.scripts_dir),
+            scripts_dir=self._scripts_dir_str,
             client_filename=self._get_client_filename(),
             run_command=self._get_run_command(),
         )
 
+    @property
+    def analysis_prompts(self) -> tuple[str, str]:
+        """Return the cached (system_prompt, user_message) pair for analysis."""
+        if self._analysis_prompts is None:
+            self._analysis_prompts = self._build_prompts()
+        return self._analysis_prompts
+
     def _build_prompts(self) -> tuple[str, str]:
         """Build the (system_prompt, user_message) pair for analysis.
 
@@ -671,17 +871,17 @@ class BaseEngineer(ABC):
 
         user_message = load(
             "engineer/user",
-            har_path=str(self.har_path),
+            har_path=self._har_path_str,
             prompt=self.prompt,
-            scripts_dir=str(self.scripts_dir),
+            scripts_dir=self._scripts_dir_str,
             existing_client_guidance=self._get_existing_client_guidance(),
             additional_instructions=additional_instructions,
             tag_mode_label="Documentation" if is_docs else "Re-engineer",
             run_id=self.run_id,
-            har_parent=str(self.har_path.parent),
+            har_parent=self._har_dir_str,
             existing_label="docs" if is_docs else "scripts",
-            messages_path=str(self.message_store.messages_path.parent),
-            is_fresh=str(self.is_fresh).lower(),
+            messages_path=self._messages_dir_str,
+            is_fresh=self._is_fresh_str,
             existing_artifact="documentation" if is_docs else "script",
         )
 
@@ -690,25 +890,25 @@ class BaseEngineer(ABC):
     def _get_auto_output_files(self, language_name: str, client_filename: str) -> str:
         """Return the output files list for auto mode prompts."""
         base = (
-            f"1. `{self.scripts_dir}/{client_filename}` - Production {language_name} API client\n"
-            f"2. `{self.scripts_dir}/README.md` - Documentation with usage examples"
+            f"1. `{self._scripts_dir_str}/{client_filename}` - Production {language_name} API client\n"
+            f"2. `{self._scripts_dir_str}/README.md` - Documentation with usage examples"
         )
         if self.output_language == "javascript":
-            return base + f"\n3. `{self.scripts_dir}/package.json` - Only if external dependencies are needed"
+            return base + f"\n3. `{self._scripts_dir_str}/package.json` - Only if external dependencies are needed"
         elif self.output_language == "typescript":
-            return base + f"\n3. `{self.scripts_dir}/package.json` - Dependencies and run scripts"
+            return base + f"\n3. `{self._scripts_dir_str}/package.json` - Dependencies and run scripts"
         elif self.output_language == "go":
             return base + (
-                f"\n3. `{self.scripts_dir}/go.mod` and `{self.scripts_dir}/go.sum` - "
+                f"\n3. `{self._scripts_dir_str}/go.mod` and `{self._scripts_dir_str}/go.sum` - "
                 "Only if external dependencies are needed"
             )
         elif self.output_language == "java":
-            return base + f"\n3. `{self.scripts_dir}/pom.xml` - Maven project file (Gson dependency, exec-maven-plugin)"
+            return base + f"\n3. `{self._scripts_dir_str}/pom.xml` - Maven project file (Gson dependency, exec-maven-plugin)"
         elif self.output_language == "csharp":
-            return base + f"\n3. `{self.scripts_dir}/ApiClient.csproj` - .NET project file"
+            return base + f"\n3. `{self._scripts_dir_str}/ApiClient.csproj` - .NET project file"
         elif self.output_language == "c":
             return base + (
-                f"\n3. `{self.scripts_dir}/cJSON.c` and `{self.scripts_dir}/cJSON.h` - "
+                f"\n3. `{self._scripts_dir_str}/cJSON.c` and `{self._scripts_dir_str}/cJSON.h` - "
                 "Vendored JSON library"
             )
         return base
@@ -717,3 +917,46 @@ class BaseEngineer(ABC):
     async def analyze_and_generate(self) -> dict[str, Any] | None:
         """Run the reverse engineering analysis. Must be implemented by subclasses."""
         pass
+
+    async def stream_events(self) -> AsyncIterator[dict[str, Any]]:
+        """Run analyze_and_generate() and yield its events as they happen.
+
+        Yields the same event dicts as --json-stream (tool_start, tool_end,
+        thinking, success, error, ...) while the run is in progress, then a
+        final ``{"event": "result", "result": ...}`` carrying the return value.
+        Closing the iterator early cancels the run. Any sink or UI already
+        attached (e.g. by attach_json_stream_to_engineer) keeps receiving
+        events, and both are restored when the iterator finishes.
+        """
+        from .json_stream import StreamingUIWrapper
+
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        previous_sink = self._json_event_sink
+        previous_ui = self.ui
+
+        def enqueue(event: dict[str, Any] | None) -> None:
+            # UI hooks can fire off the loop thread; hand events over safely.
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        def sink(event: dict[str, Any]) -> None:
+            if previous_sink:
+                previous_sink(event)
+            enqueue(event)
+
+        self._json_event_sink = sink
+        self.ui = StreamingUIWrapper(previous_ui, enqueue)
+        task = asyncio.create_task(self.analyze_and_generate())
+        task.add_done_callback(lambda _: enqueue(None))
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            result = task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+            self._json_event_sink = previous_sink
+            self.ui = previous_ui
+        yield {"event": "result", "result": result}
@@ -72,7 +72,7 @@ class CopilotEngineer(BaseEngineer):
         self.ui.header(self.run_id, self.prompt, self.copilot_model, self.sdk, mode="engineer")
         self.ui.start_analysis()
 
-        system_prompt, user_message = self._build_prompts()
+        system_prompt, user_message = self.analysis_prompts
         prompt = f"{system_prompt}\n\n{user_message}"
         self.message_store.save_prompt(user_message)
 
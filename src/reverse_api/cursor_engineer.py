@@ -375,7 +375,7 @@ class CursorEngineer(BaseEngineer):
             self.ui.console.print("\n[dim]Create an API key at https://cursor.com/dashboard/integrations[/dim]")
             return None
 
-        system_prompt, user_message = self._build_prompts()
+        system_prompt, user_message = self.analysis_prompts
         self.message_store.save_prompt(user_message)
         combined = f"{system_prompt}\n\n{user_message}"
 
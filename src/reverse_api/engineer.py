@@ -170,7 +170,7 @@ class ClaudeEngineer(BaseEngineer):
         # left over from a previous run on a reused engineer instance.
         self._context_overflowed = False
 
-        system_prompt, user_message = self._build_prompts()
+        system_prompt, user_message = self.analysis_prompts
         self.message_store.save_prompt(user_message)
 
         options = ClaudeAgentOptions(
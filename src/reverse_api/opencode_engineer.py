@@ -197,7 +197,7 @@ class OpenCodeEngineer(BaseEngineer):
         self.opencode_ui.header(self.run_id, self.prompt, self.opencode_model, self.sdk, mode="engineer")
         self.opencode_ui.start_analysis()
 
-        system_prompt, user_message = self._build_prompts()
+        system_prompt, user_message = self.analysis_prompts
         combined_prompt = f"{system_prompt}\n\n{user_message}"
         self.message_store.save_prompt(user_message)
 
@@ -1,122 +1,143 @@
 """Pricing models for different models."""
 
-MODEL_PRICING = {
-    "claude-sonnet-4-6": {
-        "input": 3.00,
-        "output": 15.00,
-        "cache_creation": 3.75,
-        "cache_read": 0.30,
-        "reasoning": 15.00,
-    },
-    "claude-opus-4-6": {
-        "input": 15.00,
-        "output": 25.00,
-        "cache_creation": 6.25,
-        "cache_read": 0.50,
-        "reasoning": 25.00,
-    },
-    "claude-haiku-4-5": {
-        "input": 1.00,
-        "output": 5.00,
-        "cache_creation": 1.25,
-        "cache_read": 0.10,
-        "reasoning": 5.00,
-    },
-    "gemini-3-flash": {
-        "input": 0.5,
-        "output": 3,
-        "cache_creation": 1,
-        "cache_read": 0.05,
-        "reasoning": 3,
-    },
-    "gemini-3-pro": {
-        "input": 3,
-        "output": 12,
-        "cache_creation": 4.5,
-        "cache_read": 0.20,
-        "reasoning": 12,
-    },
-    "gemini-3-pro-low": {
-        "input": 3,
-        "output": 12,
-        "cache_creation": 4.5,
-        "cache_read": 0.20,
-        "reasoning": 12,
-    },
-    "gemini-3-pro-high": {
-        "input": 3,
-        "output": 12,
-        "cache_creation": 4.5,
-        "cache_read": 0.20,
-        "reasoning": 12,
-    },
-    "claude-sonnet-4-6-thinking-low": {
-        "input": 3.00,
-        "output": 15.00,
-        "cache_creation": 3.75,
-        "cache_read": 0.30,
-        "reasoning": 15.00,
-    },
-    "claude-sonnet-4-6-thinking-medium": {
-        "input": 3.00,
-        "output": 15.00,
-        "cache_creation": 3.75,
-        "cache_read": 0.30,
-        "reasoning": 15.00,
-    },
-    "claude-sonnet-4-6-thinking-high": {
-        "input": 3.00,
-        "output": 15.00,
-        "cache_creation": 3.75,
-        "cache_read": 0.30,
-        "reasoning": 15.00,
-    },
-    "claude-opus-4-6-thinking-low": {
-        "input": 15.00,
-        "output": 25.00,
-        "cache_creation": 6.25,
-        "cache_read": 0.50,
-        "reasoning": 25.00,
-    },
-    "claude-opus-4-6-thinking-medium": {
-        "input": 15.00,
-        "output": 25.00,
-        "cache_creation": 6.25,
-        "cache_read": 0.50,
-        "reasoning": 25.00,
-    },
-    "claude-opus-4-6-thinking-high": {
-        "input": 15.00,
-        "output": 25.00,
-        "cache_creation": 6.25,
-        "cache_read": 0.50,
-        "reasoning": 25.00,
-    },
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Pricing:
+    """Per-million-token prices (USD) for one model."""
+
+    input: float = 0.0
+    output: float = 0.0
+    cache_creation: float = 0.0
+    cache_read: float = 0.0
+    reasoning: float = 0.0
+
+
+MODEL_PRICING: dict[str, Pricing] = {
+    "claude-sonnet-4-6": Pricing(
+        input=3.00,
+        output=15.00,
+        cache_creation=3.75,
+        cache_read=0.30,
+        reasoning=15.00,
+    ),
+    "claude-opus-4-6": Pricing(
+        input=15.00,
+        output=25.00,
+        cache_creation=6.25,
+        cache_read=0.50,
+        reasoning=25.00,
+    ),
+    "claude-haiku-4-5": Pricing(
+        input=1.00,
+        output=5.00,
+        cache_creation=1.25,
+        cache_read=0.10,
+        reasoning=5.00,
+    ),
+    "gemini-3-flash": Pricing(
+        input=0.5,
+        output=3,
+        cache_creation=1,
+        cache_read=0.05,
+        reasoning=3,
+    ),
+    "gemini-3-pro": Pricing(
+        input=3,
+        output=12,
+        cache_creation=4.5,
+        cache_read=0.20,
+        reasoning=12,
+    ),
+    "gemini-3-pro-low": Pricing(
+        input=3,
+        output=12,
+        cache_creation=4.5,
+        cache_read=0.20,
+        reasoning=12,
+    ),
+    "gemini-3-pro-high": Pricing(
+        input=3,
+        output=12,
+        cache_creation=4.5,
+        cache_read=0.20,
+        reasoning=12,
+    ),
+    "claude-sonnet-4-6-thinking-low": Pricing(
+        input=3.00,
+        output=15.00,
+        cache_creation=3.75,
+        cache_read=0.30,
+        reasoning=15.00,
+    ),
+    "claude-sonnet-4-6-thinking-medium": Pricing(
+        input=3.00,
+        output=15.00,
+        cache_creation=3.75,
+        cache_read=0.30,
+        reasoning=15.00,
+    ),
+    "claude-sonnet-4-6-thinking-high": Pricing(
+        input=3.00,
+        output=15.00,
+        cache_creation=3.75,
+        cache_read=0.30,
+        reasoning=15.00,
+    ),
+    "claude-opus-4-6-thinking-low": Pricing(
+        input=15.00,
+        output=25.00,
+        cache_creation=6.25,
+        cache_read=0.50,
+        reasoning=25.00,
+    ),
+    "claude-opus-4-6-thinking-medium": Pricing(
+        input=15.00,
+        output=25.00,
+        cache_creation=6.25,
+        cache_read=0.50,
+        reasoning=25.00,
+    ),
+    "claude-opus-4-6-thinking-high": Pricing(
+        input=15.00,
+        output=25.00,
+        cache_creation=6.25,
+        cache_read=0.50,
+        reasoning=25.00,
+    ),
     # GPT models (for Copilot SDK - cost is $0 with GitHub subscription)
-    "gpt-5": {
-        "input": 0,
-        "output": 0,
-        "cache_creation": 0,
-        "cache_read": 0,
-        "reasoning": 0,
-    },
-    "gpt-4.1": {
-        "input": 0,
-        "output": 0,
-        "cache_creation": 0,
-        "cache_read": 0,
-        "reasoning": 0,
-    },
-    "gpt-4.1-mini": {
-        "input": 0,
-        "output": 0,
-        "cache_creation": 0,
-        "cache_read": 0,
-        "reasoning": 0,
-    },
+    "gpt-5": Pricing(),
+    "gpt-4.1": Pricing(),
+    "gpt-4.1-mini": Pricing(),
 }
 
 
+def _per_token_rates(pricing: Pricing) -> tuple[float, float, float, float, float]:
+    """Convert per-million pricing into per-token (input, output, cache_creation, cache_read, reasoning) rates."""
+    return (
+        pricing.input / 1_000_000,
+        pricing.output / 1_000_000,
+        pricing.cache_creation / 1_000_000,
+        pricing.cache_read / 1_000_000,
+        pricing.reasoning / 1_000_000,
+    )
+
+
+# Model ids contain dashes, so the compiler doesn't intern them; intern them
+# here so an interned id matches a key by identity instead of string compare.
+MODEL_PRICING = {sys.intern(model_id): pricing for model_id, pricing in MODEL_PRICING.items()}
+
+# Precomputed at import so calculate_cost does one lookup and five multiplies per call
+_RATES = {model_id: _per_token_rates(pricing) for model_id, pricing in MODEL_PRICING.items()}
+
+# Fallback model, bound once so no call site subscripts MODEL_PRICING for it
+_DEFAULT_PRICING = MODEL_PRICING["claude-sonnet-4-6"]
+_DEFAULT_RATES = _per_token_rates(_DEFAULT_PRICING)
+
+
 # Model name mapping for LiteLLM compatibility
 # Maps our model IDs to possible LiteLLM model name variations
 _LITELLM_MODEL_MAP = {
@@ -204,23 +225,34 @@ def _get_pricing_from_litellm(model_id: str) -> dict[str, float] | None:
         return None
 
 
-def get_model_pricing(model_id: str) -> dict[str, float] | None:
-    """Get pricing dictionary for a model.
+def get_model_pricing(model_id: str) -> Pricing | None:
+    """Get pricing for a model.
 
     Args:
         model_id: Model identifier
 
     Returns:
-        Pricing dictionary with keys: input, output, cache_creation, cache_read, reasoning
+        Pricing with per-million-token input, output, cache_creation, cache_read and reasoning prices
         Returns None if model not found
     """
-    if model_id in MODEL_PRICING:
-        return MODEL_PRICING[model_id]
+    if (pricing := MODEL_PRICING.get(model_id)) is not None:
+        return pricing
     elif litellm_pricing := _get_pricing_from_litellm(model_id):
-        return litellm_pricing
+        return Pricing(**litellm_pricing)
     return None
 
 
+def _resolve_rates(model_id: str | None) -> tuple[float, float, float, float, float]:
+    """Return per-token rates for a model, applying the calculate_cost fallback chain."""
+    if not model_id:
+        return _DEFAULT_RATES
+    rates = _RATES.get(model_id)
+    if rates is None:
+        litellm_pricing = _get_pricing_from_litellm(model_id)
+        rates = _per_token_rates(Pricing(**litellm_pricing)) if litellm_pricing else _DEFAULT_RATES
+    return rates
+
+
 def calculate_cost(
     model_id: str | None = None,
     input_tokens: int = 0,
@@ -236,6 +268,10 @@ def calculate_cost(
     2. LiteLLM pricing package (if installed and model found)
     3. Claude Sonnet 4.6 pricing (ultimate fallback)
 
+    Callers accumulating costs over many events should pass the same
+    long-lived model id string each time (ideally ``sys.intern``-ed once)
+    rather than a freshly parsed copy per event.
+
     Args:
         model_id: Model identifier (e.g., "claude-sonnet-4-6")
         input_tokens: Number of input tokens
@@ -247,19 +283,50 @@ def calculate_cost(
     Returns:
         Total cost in USD
     """
-    if model_id in MODEL_PRICING:
-        pricing = MODEL_PRICING[model_id]
-    elif model_id and (litellm_pricing := _get_pricing_from_litellm(model_id)):
-        pricing = litellm_pricing
-    else:
-        pricing = MODEL_PRICING["claude-sonnet-4-6"]
-
-    cost = (
-        (input_tokens / 1_000_000 * pricing["input"])
-        + (output_tokens / 1_000_000 * pricing["output"])
-        + (cache_creation_tokens / 1_000_000 * pricing["cache_creation"])
-        + (cache_read_tokens / 1_000_000 * pricing["cache_read"])
-        + (reasoning_tokens / 1_000_000 * pricing["reasoning"])
+    input_rate, output_rate, cache_creation_rate, cache_read_rate, reasoning_rate = _resolve_rates(model_id)
+    return (
+        input_tokens * input_rate
+        + output_tokens * output_rate
+        + cache_creation_tokens * cache_creation_rate
+        + cache_read_tokens * cache_read_rate
+        + reasoning_tokens * reasoning_rate
     )
 
-    return cost
+
+def calculate_cost_batch(
+    model_ids: Sequence[str | None],
+    tokens: Sequence[Sequence[int]],
+) -> list[float]:
+    """Calculate costs for many usage records in one pass.
+
+    Rates are resolved once per distinct model in the batch, so aggregating
+    a long session's usage log doesn't repeat the lookup (or the LiteLLM
+    fallback) for every event.
+
+    Args:
+        model_ids: Model identifier for each record (None uses the default)
+        tokens: One (input, output, cache_creation, cache_read, reasoning)
+            token count row per record
+
+    Returns:
+        Cost in USD for each record, in input order
+    """
+    if len(model_ids) != len(tokens):
+        raise ValueError(f"Got {len(model_ids)} model ids for {len(tokens)} token rows")
+
+    resolved: dict[str | None, tuple[float, float, float, float, float]] = {}
+    costs = []
+    for model_id, row in zip(model_ids, tokens, strict=False):  # lengths checked above
+        rates = resolved.get(model_id)
+        if rates is None:
+            rates = resolved[model_id] = _resolve_rates(model_id)
+        input_rate, output_rate, cache_creation_rate, cache_read_rate, reasoning_rate = rates
+        input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens, reasoning_tokens = row
+        costs.append(
+            input_tokens * input_rate
+            + output_tokens * output_rate
+            + cache_creation_tokens * cache_creation_rate
+            + cache_read_tokens * cache_read_rate
+            + reasoning_tokens * reasoning_rate
+        )
+    return costs
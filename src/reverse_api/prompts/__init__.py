@@ -9,6 +9,7 @@ Template names use `/` as a path separator, e.g. `"auto/system"` resolves
 to `auto/system.md` relative to this package directory.
 """
 
+from functools import cache
 from pathlib import Path
 
 _PROMPTS_DIR = Path(__file__).parent
@@ -31,6 +32,17 @@ def _resolve_includes(text: str) -> str:
     return text
 
 
+@cache
+def _read_template(template_name: str) -> str:
+    """Read a template with its includes resolved, cached per process.
+
+    Templates ship with the package and never change at runtime, so each
+    file is read from disk once and only `format_map` runs per call.
+    """
+    path = _PROMPTS_DIR / f"{template_name}.md"
+    return _resolve_includes(path.read_text())
+
+
 def load(template_name: str, **kwargs: str) -> str:
     """Load a markdown prompt template and fill placeholders.
 
@@ -42,9 +54,7 @@ def load(template_name: str, **kwargs: str) -> str:
     Returns:
         The fully rendered prompt string.
     """
-    path = _PROMPTS_DIR / f"{template_name}.md"
-    text = path.read_text()
-    text = _resolve_includes(text)
+    text = _read_template(template_name)
     if kwargs:
         text = text.format_map(kwargs)
     return text
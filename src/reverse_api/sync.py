@@ -1,5 +1,6 @@
 """Real-time file synchronization with watchdog."""
 
+import os
 import shutil
 import time
 from collections.abc import Callable
@@ -20,9 +21,16 @@ def get_available_directory(base_path: Path, base_name: str) -> Path:
     """
     target_dir = base_path / base_name
 
-    # If directory doesn't exist or is empty, use it
-    if not target_dir.exists() or (target_dir.is_dir() and not any(target_dir.iterdir())):
+    # If directory doesn't exist or is empty, use it. A single scandir
+    # answers both questions, instead of exists/is_dir/iterdir round-trips.
+    try:
+        with os.scandir(target_dir) as entries:
+            if next(entries, None) is None:
+                return target_dir
+    except FileNotFoundError:
         return target_dir
+    except NotADirectoryError:
+        pass
 
     # Otherwise, create a new directory with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -40,12 +48,18 @@ class SyncHandler(FileSystemEventHandler):
         on_sync: Callable[[str], None] | None = None,
         on_error: Callable[[str], None] | None = None,
         debounce_ms: int = 500,
+        on_sync_batch: Callable[[list[str]], None] | None = None,
+        batch_window_ms: int | None = None,
     ):
         self.source_dir = source_dir
         self.dest_dir = dest_dir
         self.on_sync = on_sync
         self.on_error = on_error
+        self.on_sync_batch = on_sync_batch
         self.debounce_ms = debounce_ms / 1000.0  # Convert to seconds
+        # When set, pending files are flushed together once no new event has
+        # arrived for the whole window, instead of each file on its own timer.
+        self.batch_window = batch_window_ms / 1000.0 if batch_window_ms is not None else None
         self.pending_events = {}
         self.last_sync_time = 0
         self.file_count = 0
@@ -85,27 +99,53 @@ class SyncHandler(FileSystemEventHandler):
             "is_delete": is_delete,
         }
 
-    def process_pending(self):
-        """Process pending sync events (debounced)."""
+    def process_pending(self, force: bool = False):
+        """Process pending sync events (debounced).
+
+        With force=True every pending event is flushed regardless of age.
+        """
         current_time = time.time()
         to_sync = []
+        pending = list(self.pending_events.items())
 
-        # Find events that have passed the debounce period
-        for file_path, event_data in list(self.pending_events.items()):
-            if current_time - event_data["time"] >= self.debounce_ms:
+        if force:
+            ready = pending
+        elif self.batch_window is not None:
+            # Flush the whole burst only once it has gone quiet
+            if not pending or current_time - max(data["time"] for _, data in pending) < self.batch_window:
+                return
+            ready = pending
+        else:
+            # Find events that have passed the debounce period
+            ready = [(path, data) for path, data in pending if current_time - data["time"] >= self.debounce_ms]
+
+        # flush() and the watcher loop can both snapshot the same keys;
+        # whichever pops an entry first syncs it, the other skips it.
+        for file_path, _ in ready:
+            event_data = self.pending_events.pop(file_path, None)
+            if event_data is not None:
                 to_sync.append((file_path, event_data["is_delete"]))
-                del self.pending_events[file_path]
 
         # Sync the files
+        synced = []
         for file_path, is_delete in to_sync:
             try:
-                self._sync_file(file_path, is_delete)
+                message = self._sync_file(file_path, is_delete)
             except Exception as e:
                 if self.on_error:
                     self.on_error(f"Error syncing {Path(file_path).name}: {str(e)}")
+            else:
+                if message:
+                    synced.append(message)
+
+        if synced and self.on_sync_batch:
+            self.on_sync_batch(synced)
+
+    def _sync_file(self, source_path: str, is_delete: bool = False) -> str | None:
+        """Sync a single file from source to destination.
 
-    def _sync_file(self, source_path: str, is_delete: bool = False):
-        """Sync a single file from source to destination."""
+        Returns the notification message, or None if there was nothing to sync.
+        """
         source = Path(source_path)
         relative = source.relative_to(self.source_dir)
         dest = self.dest_dir / relative
@@ -118,7 +158,7 @@ class SyncHandler(FileSystemEventHandler):
         else:
             # Check if source file exists before attempting to copy
             if not source.exists():
-                return
+                return None
 
             # Copy to destination
             dest.parent.mkdir(parents=True, exist_ok=True)
@@ -128,20 +168,26 @@ class SyncHandler(FileSystemEventHandler):
                     self.file_count += 1
             except FileNotFoundError:
                 # File was deleted between existence check and copy, skip silently
-                return
+                return None
 
         # Update last sync time
         self.last_sync_time = time.time()
 
         # Notify of sync
+        action = "Deleted" if is_delete else "Synced"
+        message = f"{action} {source.name}"
         if self.on_sync:
-            action = "Deleted" if is_delete else "Synced"
-            self.on_sync(f"{action} {source.name}")
+            self.on_sync(message)
+        return message
 
 
 class FileSyncWatcher:
     """Watch a directory and sync files in real-time."""
 
+    # How long stop() waits for watchdog to deliver in-flight events
+    # (its inotify buffer holds some events for up to 0.5s)
+    _SETTLE_SECONDS = 0.6
+
     def __init__(
         self,
         source_dir: Path,
@@ -149,6 +195,8 @@ class FileSyncWatcher:
         on_sync: Callable[[str], None] | None = None,
         on_error: Callable[[str], None] | None = None,
         debounce_ms: int = 500,
+        on_sync_batch: Callable[[list[str]], None] | None = None,
+        batch_window_ms: int | None = None,
     ):
         self.source_dir = source_dir
         self.dest_dir = dest_dir
@@ -161,6 +209,8 @@ class FileSyncWatcher:
             on_sync=on_sync,
             on_error=on_error,
             debounce_ms=debounce_ms,
+            on_sync_batch=on_sync_batch,
+            batch_window_ms=batch_window_ms,
         )
 
         # Create observer
@@ -187,10 +237,10 @@ class FileSyncWatcher:
         """Stop watching and syncing."""
         self.stop_event.set()
 
-        # Process any remaining pending events before stopping
-        # Give it a moment to process debounced events
-        time.sleep(self.debounce_ms / 1000.0 + 0.1)
-        self.handler.process_pending()
+        # Let the observer deliver changes already on disk (e.g. a delete
+        # made just before stop) before shutting it down; _final_sync only
+        # copies, so a dropped delete would leave a stale file behind
+        time.sleep(self._SETTLE_SECONDS)
 
         self.observer.stop()
         self.observer.join(timeout=2)
@@ -198,12 +248,16 @@ class FileSyncWatcher:
         if self.process_thread:
             self.process_thread.join(timeout=2)
 
+        # The observer has stopped, so flush what's pending right away
+        # instead of waiting out the debounce window a second time
+        self.handler.process_pending(force=True)
+
         # Perform final sync of all existing files to ensure nothing is missed
         self._final_sync()
 
     def flush(self):
         """Flush pending events and perform a full sync without stopping the watcher."""
-        self.handler.process_pending()
+        self.handler.process_pending(force=True)
         self._final_sync()
 
     def _process_loop(self):
@@ -217,6 +271,7 @@ class FileSyncWatcher:
         if not self.source_dir.exists():
             return
 
+        synced = []
         for item in self.source_dir.rglob("*"):
             if not item.is_file():
                 continue
@@ -230,12 +285,17 @@ class FileSyncWatcher:
                 if not dest.exists() or item.stat().st_mtime > dest.stat().st_mtime:
                     dest.parent.mkdir(parents=True, exist_ok=True)
                     shutil.copy2(item, dest)
+                    message = f"Synced {item.name}"
+                    synced.append(message)
                     if self.handler.on_sync:
-                        self.handler.on_sync(f"Synced {item.name}")
+                        self.handler.on_sync(message)
             except (FileNotFoundError, OSError):
                 # File was deleted or inaccessible, skip silently
                 pass
 
+        if synced and self.handler.on_sync_batch:
+            self.handler.on_sync_batch(synced)
+
     def get_status(self) -> dict:
         """Get current sync status."""
         if not self.observer.is_alive():
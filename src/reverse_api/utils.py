@@ -394,33 +394,40 @@ def _validate_path_component(value: str, label: str = "run_id") -> None:
         raise ValueError(f"{label} too long: {len(value)} characters (max 64)")
 
 
-def get_har_dir(run_id: str, output_dir: str | None = None) -> Path:
-    """Get the HAR directory for a specific run.
-
-    Args:
-        run_id: Run identifier (must be alphanumeric with hyphens/underscores only)
-        output_dir: Optional custom output directory
-
-    Returns:
-        Path to the HAR directory
+def _checked_run_dir(base_dir: Path, kind: str, run_id: str) -> Path:
+    """Validate run_id and return ``base_dir / kind / run_id``.
 
     Raises:
         ValueError: If run_id contains invalid characters or attempts path traversal
     """
     _validate_path_component(run_id)
 
-    base_dir = get_base_output_dir(output_dir)
-    har_dir = base_dir / "har" / run_id
+    run_dir = base_dir / kind / run_id
 
     # Verify the resolved path is within the base directory (defense in depth)
     try:
-        har_dir_resolved = har_dir.resolve()
-        base_dir_resolved = base_dir.resolve()
-        if not har_dir_resolved.is_relative_to(base_dir_resolved):
+        if not run_dir.resolve().is_relative_to(base_dir.resolve()):
             raise ValueError(f"Path traversal detected: {run_id}")
     except (OSError, RuntimeError) as e:
         raise ValueError(f"Invalid path for run_id {run_id}: {e}") from e
 
+    return run_dir
+
+
+def get_har_dir(run_id: str, output_dir: str | None = None) -> Path:
+    """Get the HAR directory for a specific run.
+
+    Args:
+        run_id: Run identifier (must be alphanumeric with hyphens/underscores only)
+        output_dir: Optional custom output directory
+
+    Returns:
+        Path to the HAR directory
+
+    Raises:
+        ValueError: If run_id contains invalid characters or attempts path traversal
+    """
+    har_dir = _checked_run_dir(get_base_output_dir(output_dir), "har", run_id)
     har_dir.mkdir(parents=True, exist_ok=True)
     return har_dir
 
@@ -438,20 +445,7 @@ def get_scripts_dir(run_id: str, output_dir: str | None = None) -> Path:
     Raises:
         ValueError: If run_id contains invalid characters or attempts path traversal
     """
-    _validate_path_component(run_id)
-
-    base_dir = get_base_output_dir(output_dir)
-    scripts_dir = base_dir / "scripts" / run_id
-
-    # Verify the resolved path is within the base directory (defense in depth)
-    try:
-        scripts_dir_resolved = scripts_dir.resolve()
-        base_dir_resolved = base_dir.resolve()
-        if not scripts_dir_resolved.is_relative_to(base_dir_resolved):
-            raise ValueError(f"Path traversal detected: {run_id}")
-    except (OSError, RuntimeError) as e:
-        raise ValueError(f"Invalid path for run_id {run_id}: {e}") from e
-
+    scripts_dir = _checked_run_dir(get_base_output_dir(output_dir), "scripts", run_id)
     scripts_dir.mkdir(parents=True, exist_ok=True)
     return scripts_dir
 
@@ -469,20 +463,7 @@ def get_docs_dir(run_id: str, output_dir: str | None = None) -> Path:
     Raises:
         ValueError: If run_id contains invalid characters or attempts path traversal
     """
-    _validate_path_component(run_id)
-
-    base_dir = get_base_output_dir(output_dir)
-    docs_dir = base_dir / "docs" / run_id
-
-    # Verify the resolved path is within the base directory (defense in depth)
-    try:
-        docs_dir_resolved = docs_dir.resolve()
-        base_dir_resolved = base_dir.resolve()
-        if not docs_dir_resolved.is_relative_to(base_dir_resolved):
-            raise ValueError(f"Path traversal detected: {run_id}")
-    except (OSError, RuntimeError) as e:
-        raise ValueError(f"Invalid path for run_id {run_id}: {e}") from e
-
+    docs_dir = _checked_run_dir(get_base_output_dir(output_dir), "docs", run_id)
     docs_dir.mkdir(parents=True, exist_ok=True)
     return docs_dir
 
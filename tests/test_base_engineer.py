@@ -1,5 +1,6 @@
 """Tests for base_engineer.py - BaseEngineer abstract class."""
 
+import asyncio
 import shlex
 from pathlib import Path
 from typing import Any
@@ -42,6 +43,37 @@ class TestBaseEngineerInit:
                 assert engineer.is_fresh is False
                 assert engineer.output_language == "python"
 
+    def test_base_attributes_are_slotted(self, tmp_path):
+        """Attributes set by BaseEngineer.__init__ live in slots, not the instance dict."""
+        har_path = tmp_path / "test.har"
+        har_path.touch()
+
+        with patch("reverse_api.base_engineer.get_scripts_dir", return_value=tmp_path / "scripts"):
+            with patch("reverse_api.base_engineer.MessageStore"):
+                engineer = ConcreteEngineer(run_id="test123", har_path=har_path, prompt="test prompt")
+
+        assert engineer.__dict__ == {}
+        assert engineer.run_id == "test123"
+
+    def test_ui_created_lazily(self, tmp_path):
+        """ClaudeUI is only built on first access, and an assigned UI is kept."""
+        har_path = tmp_path / "test.har"
+        har_path.touch()
+
+        with patch("reverse_api.base_engineer.get_scripts_dir", return_value=tmp_path / "scripts"):
+            with patch("reverse_api.base_engineer.MessageStore"):
+                engineer = ConcreteEngineer(run_id="test123", har_path=har_path, prompt="test prompt", verbose=False)
+
+        with patch("reverse_api.tui.ClaudeUI") as mock_ui_cls:
+            assert engineer._ui is None
+            assert engineer.ui is mock_ui_cls.return_value
+            assert engineer.ui is mock_ui_cls.return_value
+            mock_ui_cls.assert_called_once_with(verbose=False)
+
+        custom_ui = MagicMock()
+        engineer.ui = custom_ui
+        assert engineer.ui is custom_ui
+
     def test_docs_mode(self, tmp_path):
         """Docs mode uses docs directory."""
         har_path = tmp_path / "test.har"
@@ -285,6 +317,13 @@ class TestBaseEngineerHelpers:
         pom_arg = tokens[3]
         assert Path(pom_arg).is_absolute()
         assert pom_arg == str(eng.scripts_dir.resolve() / "pom.xml")
+
+    def test_scripts_dir_str_follows_reassignment(self, tmp_path):
+        """Reassigning scripts_dir refreshes its cached string form."""
+        eng = self._make_engineer(tmp_path)
+        eng.scripts_dir = tmp_path / "other"
+        assert eng._scripts_dir_str == str(tmp_path / "other")
+
     def test_get_run_command_csharp(self, tmp_path):
         """Run command for C# points --project at this run's own (resolved,
         shell-quoted) .csproj, not a bare `dotnet run` — the agent's cwd is
@@ -557,6 +596,14 @@ class TestBaseEngineerBuildPrompt:
         system_prompt, user_message = eng._build_prompts()
         assert "Run Context" in user_message
         assert eng.run_id in user_message
+        assert f"Message history: {tmp_path / 'messages'}" in user_message
+        assert "Fresh mode: false" in user_message
+
+    def test_prompt_fresh_mode_flag(self, tmp_path):
+        """Fresh runs are flagged in the run context."""
+        eng = self._make_engineer(tmp_path, is_fresh=True)
+        system_prompt, user_message = eng._build_prompts()
+        assert "Fresh mode: true" in user_message
 
     def test_prompt_includes_existing_client_guidance(self, tmp_path):
         """User message tells the agent to keep editing the existing client language."""
@@ -586,6 +633,111 @@ class TestBaseEngineerBuildPrompt:
         assert "iterative edit" in user_message
         assert "JavaScript" in user_message
 
+    def test_analysis_prompts_built_once(self, tmp_path):
+        """analysis_prompts renders the templates once and reuses the result."""
+        eng = self._make_engineer(tmp_path)
+        with patch.object(eng, "_build_prompts", wraps=eng._build_prompts) as mock_build:
+            first = eng.analysis_prompts
+            second = eng.analysis_prompts
+        assert first is second
+        mock_build.assert_called_once()
+        assert first == eng._build_prompts()
+
+    def test_analysis_prompts_reset_by_setters(self, tmp_path):
+        """Reassigning scripts_dir, har_path or is_fresh rebuilds the prompts."""
+        eng = self._make_engineer(tmp_path)
+        first = eng.analysis_prompts
+        eng.scripts_dir = tmp_path / "moved"
+        assert eng.analysis_prompts != first
+        assert str(tmp_path / "moved") in eng.analysis_prompts[1]
+
+        eng.har_path = tmp_path / "other" / "new.har"
+        _, user_message = eng.analysis_prompts
+        assert str(tmp_path / "other" / "new.har") in user_message
+        assert eng._har_dir_str == str(tmp_path / "other")
+
+        eng.is_fresh = True
+        assert eng._analysis_prompts is None
+        assert eng._is_fresh_str == "true"
+
+
+class StreamingEngineer(BaseEngineer):
+    """Engineer that reports progress through the UI and the event sink."""
+
+    async def analyze_and_generate(self) -> dict[str, Any] | None:
+        self.ui.tool_start("Read", {"file_path": "test.har"})
+        self._emit_json_event({"event": "ask_user_skipped", "count": 1})
+        self.ui.success("/tmp/scripts/api_client.py")
+        return {"script_path": "/tmp/scripts/api_client.py"}
+
+
+class TestBaseEngineerStreamEvents:
+    """Test the stream_events async iterator."""
+
+    def _make_engineer(self, tmp_path):
+        with patch("reverse_api.base_engineer.get_scripts_dir", return_value=tmp_path / "scripts"):
+            with patch("reverse_api.base_engineer.MessageStore") as mock_ms:
+                mock_ms.return_value.messages_path = tmp_path / "messages" / "test.jsonl"
+                eng = StreamingEngineer(run_id="test123", har_path=tmp_path / "test.har", prompt="test")
+        eng.ui = MagicMock()
+        return eng
+
+    async def test_yields_progress_then_result(self, tmp_path):
+        """Events arrive in order, followed by the analyze_and_generate result."""
+        eng = self._make_engineer(tmp_path)
+        ui = eng.ui
+        events = [event async for event in eng.stream_events()]
+        assert [e["event"] for e in events] == ["tool_start", "ask_user_skipped", "success", "result"]
+        assert events[-1]["result"] == {"script_path": "/tmp/scripts/api_client.py"}
+        ui.success.assert_called_once_with("/tmp/scripts/api_client.py", None)
+        assert eng.ui is ui
+        assert eng._json_event_sink is None
+
+    async def test_existing_sink_still_receives_events(self, tmp_path):
+        """A sink attached before streaming keeps getting events."""
+        eng = self._make_engineer(tmp_path)
+        seen = []
+        eng._json_event_sink = seen.append
+        async for _ in eng.stream_events():
+            pass
+        assert seen == [{"event": "ask_user_skipped", "count": 1}]
+        assert eng._json_event_sink == seen.append
+
+    async def test_early_close_cancels_run(self, tmp_path):
+        """Closing the iterator early cancels the underlying run."""
+        eng = self._make_engineer(tmp_path)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_run():
+            eng.ui.tool_start("Read", None)
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        eng.analyze_and_generate = slow_run
+        stream = eng.stream_events()
+        first = await anext(stream)
+        assert first["event"] == "tool_start"
+        await stream.aclose()
+        assert started.is_set()
+        assert cancelled.is_set()
+
+    async def test_run_error_propagates(self, tmp_path):
+        """An exception from the run is raised from the iterator."""
+        eng = self._make_engineer(tmp_path)
+
+        async def failing_run():
+            raise RuntimeError("boom")
+
+        eng.analyze_and_generate = failing_run
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in eng.stream_events():
+                pass
+
 
 class TestBaseEngineerSync:
     """Test sync-related methods."""
@@ -625,6 +777,16 @@ class TestBaseEngineerSync:
         eng.stop_sync()  # Should not raise
         assert eng.sync_watcher is None
 
+    async def test_flush_sync_async(self, tmp_path):
+        """Async flush delegates to the watcher and is a no-op without one."""
+        eng = self._make_engineer(tmp_path)
+        await eng.flush_sync_async()  # Should not raise
+
+        mock_watcher = MagicMock()
+        eng.sync_watcher = mock_watcher
+        await eng.flush_sync_async()
+        mock_watcher.flush.assert_called_once()
+
     def test_get_sync_status_no_watcher(self, tmp_path):
         """Sync status returns None with no watcher."""
         eng = self._make_engineer(tmp_path)
@@ -648,8 +810,8 @@ class TestBaseEngineerSync:
         eng.scripts_dir = scripts_dir
 
         with patch("reverse_api.base_engineer.generate_folder_name", return_value="test_project"):
-            with patch("reverse_api.base_engineer.get_available_directory", return_value=tmp_path / "local" / "test_project"):
-                with patch("reverse_api.base_engineer.FileSyncWatcher") as mock_watcher_cls:
+            with patch("reverse_api.sync.get_available_directory", return_value=tmp_path / "local" / "test_project"):
+                with patch("reverse_api.sync.FileSyncWatcher") as mock_watcher_cls:
                     mock_watcher = MagicMock()
                     mock_watcher_cls.return_value = mock_watcher
 
@@ -659,6 +821,125 @@ class TestBaseEngineerSync:
                     assert eng.local_scripts_dir == tmp_path / "local" / "test_project"
                     mock_watcher.start.assert_called_once()
 
+                    eng.stop_sync()
+                    assert eng._sync_drain_thread is None
+
+    def test_drain_sync_events_coalesces_syncs(self, tmp_path):
+        """Queued syncs collapse to the latest; every error is shown."""
+        import queue
+
+        eng = self._make_engineer(tmp_path)
+        eng.ui = MagicMock()
+        events = queue.SimpleQueue()
+        events.put(("sync", "Synced a.py"))
+        events.put(("error", "Error syncing b.py"))
+        events.put(("sync", "Synced c.py"))
+        events.put(("error", "Error syncing d.py"))
+        events.put(None)
+
+        eng._drain_sync_events(events)
+
+        eng.ui.sync_flash.assert_called_once_with("Synced c.py")
+        assert [c.args[0] for c in eng.ui.sync_error.call_args_list] == ["Error syncing b.py", "Error syncing d.py"]
+
+    def test_stop_sync_flushes_watcher_events(self, tmp_path):
+        """Events emitted by the watcher's final sync reach the UI before stop returns."""
+        scripts_dir = tmp_path / "scripts"
+        scripts_dir.mkdir(parents=True)
+        eng = self._make_engineer(tmp_path, enable_sync=True)
+        eng.scripts_dir = scripts_dir
+        eng.ui = MagicMock()
+
+        with patch("reverse_api.base_engineer.generate_folder_name", return_value="test_project"):
+            with patch("reverse_api.sync.FileSyncWatcher") as mock_watcher_cls:
+                eng.start_sync()
+                on_sync_batch = mock_watcher_cls.call_args.kwargs["on_sync_batch"]
+                mock_watcher_cls.return_value.stop.side_effect = lambda: on_sync_batch(["Synced api_client.py"])
+                eng.stop_sync()
+
+        eng.ui.sync_flash.assert_called_with("Synced api_client.py")
+
+    def test_flush_sync_waits_for_rendered_messages(self, tmp_path):
+        """Sync messages from a flush are shown before flush_sync returns."""
+        import time
+
+        scripts_dir = tmp_path / "scripts"
+        scripts_dir.mkdir(parents=True)
+        eng = self._make_engineer(tmp_path, enable_sync=True)
+        eng.scripts_dir = scripts_dir
+        order = []
+        eng.ui = MagicMock()
+
+        def slow_flash(message):
+            time.sleep(0.05)
+            order.append(message)
+
+        eng.ui.sync_flash.side_effect = slow_flash
+
+        with patch("reverse_api.base_engineer.generate_folder_name", return_value="test_project"):
+            with patch("reverse_api.sync.FileSyncWatcher") as mock_watcher_cls:
+                eng.start_sync()
+                on_sync_batch = mock_watcher_cls.call_args.kwargs["on_sync_batch"]
+                mock_watcher_cls.return_value.flush.side_effect = lambda: on_sync_batch(["Synced api_client.py"])
+                eng.flush_sync()
+                order.append("prompt")
+                eng.stop_sync()
+
+        assert order == ["Synced api_client.py", "prompt"]
+
+    def test_drain_sync_events_survives_ui_errors(self, tmp_path):
+        """A failing render doesn't stop later messages or stall flush barriers."""
+        import queue
+        import threading
+
+        eng = self._make_engineer(tmp_path)
+        eng.ui = MagicMock()
+        eng.ui.sync_error.side_effect = BrokenPipeError
+        eng.ui.sync_flash.side_effect = [BrokenPipeError, None]
+        events = queue.SimpleQueue()
+        barrier = threading.Event()
+        events.put(("error", "Error syncing a.py"))
+        events.put(("sync", "Synced b.py"))
+        events.put(barrier)
+        drain = threading.Thread(target=eng._drain_sync_events, args=(events,), daemon=True)
+        drain.start()
+
+        assert barrier.wait(timeout=1)
+        events.put(("sync", "Synced c.py"))
+        events.put(None)
+        drain.join(timeout=1)
+
+        assert not drain.is_alive()
+        eng.ui.sync_flash.assert_called_with("Synced c.py")
+
+    def test_start_sync_reports_batches(self, tmp_path):
+        """A multi-file batch is reported as a single summary notification."""
+        scripts_dir = tmp_path / "scripts"
+        scripts_dir.mkdir(parents=True)
+        eng = self._make_engineer(tmp_path, enable_sync=True)
+        eng.scripts_dir = scripts_dir
+        eng.ui = MagicMock()
+
+        with patch("reverse_api.base_engineer.generate_folder_name", return_value="test_project"):
+            with patch("reverse_api.sync.FileSyncWatcher") as mock_watcher_cls:
+                eng.start_sync()
+                assert mock_watcher_cls.call_args.kwargs["batch_window_ms"] == 800
+                on_sync_batch = mock_watcher_cls.call_args.kwargs["on_sync_batch"]
+                mock_watcher_cls.return_value.stop.side_effect = lambda: on_sync_batch(
+                    ["Synced api_client.py", "Synced README.md", "Deleted old.py"]
+                )
+                eng.stop_sync()
+
+        eng.ui.sync_flash.assert_called_with("Synced 2 files, deleted 1")
+
+    def test_summarize_sync_batch_counts_kinds(self):
+        """Deletions are counted separately from copies in batch summaries."""
+        summarize = BaseEngineer._summarize_sync_batch
+        assert summarize(["Deleted old.py"]) == "Deleted old.py"
+        assert summarize(["Synced a.py", "Synced b.py"]) == "Synced 2 files"
+        assert summarize(["Deleted a.py", "Deleted b.py"]) == "Deleted 2 files"
+        assert summarize(["Synced a.py", "Deleted b.py", "Deleted c.py"]) == "Synced 1 file, deleted 2"
+
     def test_start_sync_docs_mode(self, tmp_path):
         """Start sync uses docs directory in docs mode."""
         docs_dir = tmp_path / "docs"
@@ -679,8 +960,8 @@ class TestBaseEngineerSync:
                     )
 
         with patch("reverse_api.base_engineer.generate_folder_name", return_value="test_docs"):
-            with patch("reverse_api.base_engineer.get_available_directory", return_value=tmp_path / "local" / "test_docs"):
-                with patch("reverse_api.base_engineer.FileSyncWatcher") as mock_watcher_cls:
+            with patch("reverse_api.sync.get_available_directory", return_value=tmp_path / "local" / "test_docs"):
+                with patch("reverse_api.sync.FileSyncWatcher") as mock_watcher_cls:
                     mock_watcher = MagicMock()
                     mock_watcher_cls.return_value = mock_watcher
                     eng.start_sync()
@@ -1,14 +1,19 @@
 """Tests for pricing.py - Model pricing and cost calculations."""
 
+import sys
+from dataclasses import FrozenInstanceError, fields
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from reverse_api.pricing import (
     MODEL_PRICING,
+    Pricing,
     _LITELLM_MODEL_MAP,
+    _RATES,
     _get_pricing_from_litellm,
     calculate_cost,
+    calculate_cost_batch,
     get_model_pricing,
 )
 
@@ -38,27 +43,50 @@ class TestModelPricing:
         assert "claude-opus-4-6-thinking-medium" in MODEL_PRICING
         assert "claude-opus-4-6-thinking-high" in MODEL_PRICING
 
-    def test_pricing_keys(self):
-        """Each model has required pricing keys."""
-        required_keys = {"input", "output", "cache_creation", "cache_read", "reasoning"}
+    def test_pricing_entries(self):
+        """Each model maps to a Pricing entry."""
         for model_id, pricing in MODEL_PRICING.items():
-            assert set(pricing.keys()) == required_keys, f"Model {model_id} missing keys"
+            assert isinstance(pricing, Pricing), f"Model {model_id} is not a Pricing"
 
     def test_pricing_values_positive(self):
         """All pricing values are positive."""
         for model_id, pricing in MODEL_PRICING.items():
-            for key, value in pricing.items():
-                assert value >= 0, f"Model {model_id} has negative {key}: {value}"
+            for field in fields(Pricing):
+                value = getattr(pricing, field.name)
+                assert value >= 0, f"Model {model_id} has negative {field.name}: {value}"
 
     def test_opus_more_expensive_than_sonnet(self):
         """Opus should be more expensive than Sonnet."""
-        assert MODEL_PRICING["claude-opus-4-6"]["input"] > MODEL_PRICING["claude-sonnet-4-6"]["input"]
-        assert MODEL_PRICING["claude-opus-4-6"]["output"] > MODEL_PRICING["claude-sonnet-4-6"]["output"]
+        assert MODEL_PRICING["claude-opus-4-6"].input > MODEL_PRICING["claude-sonnet-4-6"].input
+        assert MODEL_PRICING["claude-opus-4-6"].output > MODEL_PRICING["claude-sonnet-4-6"].output
 
     def test_haiku_cheapest_claude(self):
         """Haiku should be cheapest Claude model."""
-        assert MODEL_PRICING["claude-haiku-4-5"]["input"] < MODEL_PRICING["claude-sonnet-4-6"]["input"]
-        assert MODEL_PRICING["claude-haiku-4-5"]["output"] < MODEL_PRICING["claude-sonnet-4-6"]["output"]
+        assert MODEL_PRICING["claude-haiku-4-5"].input < MODEL_PRICING["claude-sonnet-4-6"].input
+        assert MODEL_PRICING["claude-haiku-4-5"].output < MODEL_PRICING["claude-sonnet-4-6"].output
+
+    def test_model_ids_interned(self):
+        """Model id keys are interned so interned lookups match by identity."""
+        for model_id in MODEL_PRICING:
+            assert sys.intern("".join(list(model_id))) is model_id
+
+    def test_pricing_entries_read_only(self):
+        """Pricing entries can't be mutated out from under the rate table."""
+        with pytest.raises(FrozenInstanceError):
+            MODEL_PRICING["claude-sonnet-4-6"].input = 0.0
+
+    def test_rates_match_pricing(self):
+        """Precomputed per-token rates mirror MODEL_PRICING."""
+        for model_id, pricing in MODEL_PRICING.items():
+            assert _RATES[model_id] == pytest.approx(
+                (
+                    pricing.input / 1_000_000,
+                    pricing.output / 1_000_000,
+                    pricing.cache_creation / 1_000_000,
+                    pricing.cache_read / 1_000_000,
+                    pricing.reasoning / 1_000_000,
+                )
+            )
 
 
 class TestGetModelPricing:
@@ -68,8 +96,14 @@ class TestGetModelPricing:
         """Returns pricing for known model."""
         pricing = get_model_pricing("claude-sonnet-4-6")
         assert pricing is not None
-        assert pricing["input"] == 3.00
-        assert pricing["output"] == 15.00
+        assert pricing.input == 3.00
+        assert pricing.output == 15.00
+
+    def test_known_model_skips_litellm(self):
+        """A local hit returns the shared entry without consulting litellm."""
+        with patch("reverse_api.pricing._get_pricing_from_litellm") as mock_litellm:
+            assert get_model_pricing("claude-haiku-4-5") is MODEL_PRICING["claude-haiku-4-5"]
+        mock_litellm.assert_not_called()
 
     def test_unknown_model_no_litellm(self):
         """Returns None for unknown model when litellm not available."""
@@ -82,7 +116,7 @@ class TestGetModelPricing:
         mock_pricing = {"input": 1.0, "output": 2.0, "cache_creation": 0, "cache_read": 0, "reasoning": 2.0}
         with patch("reverse_api.pricing._get_pricing_from_litellm", return_value=mock_pricing):
             pricing = get_model_pricing("some-litellm-model")
-            assert pricing == mock_pricing
+            assert pricing == Pricing(**mock_pricing)
 
 
 class TestGetPricingFromLitellm:
@@ -289,3 +323,37 @@ class TestCalculateCost:
         sonnet_cost = calculate_cost("claude-sonnet-4-6", input_tokens=1_000_000, output_tokens=1_000_000)
         haiku_cost = calculate_cost("claude-haiku-4-5", input_tokens=1_000_000, output_tokens=1_000_000)
         assert haiku_cost < sonnet_cost
+
+
+class TestCalculateCostBatch:
+    """Test calculate_cost_batch function."""
+
+    def test_matches_scalar(self):
+        """Batch results match calculate_cost for each record."""
+        model_ids = ["claude-sonnet-4-6", "claude-haiku-4-5", None, "claude-sonnet-4-6"]
+        tokens = [
+            (1000, 500, 0, 0, 0),
+            (1_000_000, 1_000_000, 10, 20, 30),
+            (1_000_000, 0, 0, 0, 0),
+            (0, 0, 1_000_000, 1_000_000, 1_000_000),
+        ]
+        costs = calculate_cost_batch(model_ids, tokens)
+        expected = [calculate_cost(m, *row) for m, row in zip(model_ids, tokens, strict=True)]
+        assert costs == pytest.approx(expected)
+
+    def test_empty(self):
+        """Empty batch gives empty result."""
+        assert calculate_cost_batch([], []) == []
+
+    def test_length_mismatch_raises(self):
+        """Mismatched inputs are rejected."""
+        with pytest.raises(ValueError):
+            calculate_cost_batch(["claude-sonnet-4-6"], [])
+
+    def test_litellm_resolved_once_per_model(self):
+        """Unknown models hit the LiteLLM fallback once per batch."""
+        litellm_pricing = {"input": 1.0, "output": 2.0, "cache_creation": 0, "cache_read": 0, "reasoning": 2.0}
+        with patch("reverse_api.pricing._get_pricing_from_litellm", return_value=litellm_pricing) as mock_litellm:
+            costs = calculate_cost_batch(["custom-model"] * 3, [(1_000_000, 1_000_000, 0, 0, 0)] * 3)
+        mock_litellm.assert_called_once_with("custom-model")
+        assert costs == pytest.approx([3.0, 3.0, 3.0])
@@ -36,6 +36,18 @@ class TestLoad:
         with pytest.raises(FileNotFoundError):
             load("nonexistent_template")
 
+    def test_template_read_once(self):
+        """Repeated loads reuse the cached template text."""
+        from reverse_api.prompts import _read_template
+
+        _read_template.cache_clear()
+        first = load("collector/user", prompt="a", items_path="/tmp/a.jsonl")
+        second = load("collector/user", prompt="b", items_path="/tmp/b.jsonl")
+        assert "/tmp/a.jsonl" in first
+        assert "/tmp/b.jsonl" in second
+        assert _read_template.cache_info().misses == 1
+        assert _read_template.cache_info().hits == 1
+
 
 class TestLoadLanguagePartial:
     """Test language-specific partials."""
@@ -50,6 +62,9 @@ class TestLoadLanguagePartial:
         assert "Python script" in text
         assert "requests" in text
         assert "/tmp/scripts/api_client.py" in text
+        assert "functools.lru_cache(maxsize=1)" in text
+        assert "/tmp/scripts/.cache/endpoints.json" in text
+        assert '{"key": key, "endpoints": endpoints}' in text
 
     def test_javascript_partial(self):
         text = load_language_partial(
@@ -151,6 +166,7 @@ class TestEngineerTemplates:
         assert "HAR" in text
         assert "AskUserQuestion" in text
         assert "scratchpad" in text
+        assert 'ijson.items(f, "log.entries.item")' in text
 
     def test_engineer_user_loads(self):
         text = load(
@@ -39,6 +39,17 @@ class TestGetAvailableDirectory:
         assert result != target
         assert str(result).startswith(str(tmp_path / "test_dir_"))
 
+    def test_existing_file(self, tmp_path):
+        """Returns timestamped dir when a file occupies the target name."""
+        (tmp_path / "test_dir").write_text("content")
+        result = get_available_directory(tmp_path, "test_dir")
+        assert str(result).startswith(str(tmp_path / "test_dir_"))
+
+    def test_missing_base_path(self, tmp_path):
+        """Returns target dir when the base path itself doesn't exist yet."""
+        result = get_available_directory(tmp_path / "missing", "test_dir")
+        assert result == tmp_path / "missing" / "test_dir"
+
 
 class TestSyncHandler:
     """Test SyncHandler class."""
@@ -253,6 +264,93 @@ class TestSyncHandler:
         # File should NOT have been synced yet (debounce not expired)
         assert not (dest / "test.py").exists()
 
+    def test_process_pending_force_ignores_debounce(self, tmp_path):
+        """force=True flushes events that are still inside the debounce period."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        src_file = source / "test.py"
+        src_file.write_text("content")
+
+        handler = SyncHandler(source, dest, debounce_ms=5000)
+        handler._queue_sync(str(src_file))
+        handler.process_pending(force=True)
+
+        assert (dest / "test.py").exists()
+        assert handler.pending_events == {}
+
+    def test_process_pending_skips_entries_taken_concurrently(self, tmp_path):
+        """An entry another thread took after the snapshot is skipped, not a KeyError."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "a.py").write_text("a")
+        (source / "b.py").write_text("b")
+
+        class RacingPending(dict):
+            def items(self):
+                snapshot = list(super().items())
+                self.pop(str(source / "a.py"))  # taken by the other thread
+                return snapshot
+
+        on_sync_batch = MagicMock()
+        handler = SyncHandler(source, dest, on_sync_batch=on_sync_batch)
+        handler.pending_events = RacingPending()
+        handler._queue_sync(str(source / "a.py"))
+        handler._queue_sync(str(source / "b.py"))
+        handler.process_pending(force=True)
+
+        assert not (dest / "a.py").exists()
+        assert (dest / "b.py").exists()
+        on_sync_batch.assert_called_once_with(["Synced b.py"])
+
+    def test_batch_window_waits_for_quiet_period(self, tmp_path):
+        """Batch mode holds the whole burst until no event arrives for the window."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "a.py").write_text("a")
+        (source / "b.py").write_text("b")
+
+        on_sync_batch = MagicMock()
+        handler = SyncHandler(source, dest, on_sync_batch=on_sync_batch, batch_window_ms=5000)
+        handler._queue_sync(str(source / "a.py"))
+        handler.pending_events[str(source / "a.py")]["time"] -= 10  # old event
+        handler._queue_sync(str(source / "b.py"))  # fresh event keeps the burst open
+        handler.process_pending()
+
+        assert not (dest / "a.py").exists()
+        on_sync_batch.assert_not_called()
+
+    def test_batch_window_flushes_once(self, tmp_path):
+        """A quiet burst is synced together and reported in one callback."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "a.py").write_text("a")
+        (source / "b.py").write_text("b")
+        (dest / "gone.py").write_text("old")
+
+        on_sync = MagicMock()
+        on_sync_batch = MagicMock()
+        handler = SyncHandler(source, dest, on_sync=on_sync, on_sync_batch=on_sync_batch, batch_window_ms=0)
+        handler._queue_sync(str(source / "a.py"))
+        handler._queue_sync(str(source / "b.py"))
+        handler._queue_sync(str(source / "gone.py"), is_delete=True)
+        handler._queue_sync(str(source / "missing.py"))
+        handler.process_pending()
+
+        assert (dest / "a.py").exists()
+        assert (dest / "b.py").exists()
+        assert not (dest / "gone.py").exists()
+        assert handler.pending_events == {}
+        on_sync_batch.assert_called_once_with(["Synced a.py", "Synced b.py", "Deleted gone.py"])
+        assert on_sync.call_count == 3
+
 
 class TestSyncDirectoryOnce:
     """Test sync_directory_once function."""
@@ -370,3 +468,53 @@ class TestFileSyncWatcher:
 
         # Final sync should have copied the file
         assert (dest / "pre_existing.py").exists()
+
+    def test_final_sync_reports_batch(self, tmp_path):
+        """Final sync reports everything it copied in one batch callback."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "a.py").write_text("a")
+        (source / "b.py").write_text("b")
+
+        on_sync_batch = MagicMock()
+        watcher = FileSyncWatcher(source, dest, on_sync_batch=on_sync_batch, batch_window_ms=100)
+        watcher._final_sync()
+
+        on_sync_batch.assert_called_once()
+        assert sorted(on_sync_batch.call_args[0][0]) == ["Synced a.py", "Synced b.py"]
+
+    def test_stop_flushes_pending_without_waiting(self, tmp_path):
+        """stop() applies pending events immediately rather than sleeping out the window."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (dest / "gone.py").write_text("old")
+
+        watcher = FileSyncWatcher(source, dest, batch_window_ms=5000)
+        watcher.start()
+        watcher.handler._queue_sync(str(source / "gone.py"), is_delete=True)
+        started = time.time()
+        watcher.stop()
+
+        assert time.time() - started < 5
+        assert not (dest / "gone.py").exists()
+
+    def test_stop_applies_delete_made_just_before(self, tmp_path):
+        """A file unlinked right before stop() is removed from the destination too."""
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+
+        watcher = FileSyncWatcher(source, dest, debounce_ms=100)
+        watcher.start()
+        (source / "temp.py").write_text("temp")
+        time.sleep(1)
+        assert (dest / "temp.py").exists()
+        (source / "temp.py").unlink()
+        watcher.stop()
+
+        assert not (dest / "temp.py").exists()
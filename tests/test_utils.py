@@ -268,6 +268,18 @@ class TestGetScriptsDir:
         with pytest.raises(ValueError, match="too long"):
             get_scripts_dir("x" * 65)
 
+    def test_repeat_call_rechecks_traversal(self, tmp_path):
+        """A symlink planted after the first call is still caught on the next one."""
+        from reverse_api.utils import get_scripts_dir
+
+        first = get_scripts_dir("repeat123", str(tmp_path / "base"))
+        first.rmdir()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        first.symlink_to(outside, target_is_directory=True)
+        with pytest.raises(ValueError, match="Path traversal"):
+            get_scripts_dir("repeat123", str(tmp_path / "base"))
+
 
 class TestGetDocsDir:
     """Test get_docs_dir with validation."""